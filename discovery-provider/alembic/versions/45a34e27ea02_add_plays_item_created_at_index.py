@@ -0,0 +1,31 @@
+"""add plays item created at index
+
+Revision ID: 45a34e27ea02
+Revises: 7104383ac0fe
+Create Date: 2022-01-20 18:42:07.119011
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "45a34e27ea02"
+down_revision = "7104383ac0fe"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Supports DISTINCT ON (play_item_id) ... ORDER BY play_item_id, created_at DESC
+    # in get_track_listen_milestones so it can walk the index instead of
+    # aggregating the full plays table
+    op.create_index(
+        op.f("ix_plays_item_created_at"),
+        "plays",
+        ["play_item_id", sa.text("created_at DESC")],
+        unique=False,
+    )
+
+
+def downgrade():
+    op.drop_index(op.f("ix_plays_item_created_at"), table_name="plays")
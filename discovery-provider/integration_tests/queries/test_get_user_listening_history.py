@@ -0,0 +1,154 @@
+import os
+from datetime import datetime
+
+import alembic
+import alembic.config
+import pytest
+from integration_tests.conftest import DB_URL, TEST_CONFIG_OVERRIDE
+from integration_tests.utils import populate_mock_db
+from sqlalchemy_utils import create_database, database_exists, drop_database
+from src.app import create_app
+from src.queries.get_user_listening_history import (
+    GetUserListeningHistoryArgs,
+    _get_user_listening_history,
+)
+from src.tasks.user_listening_history.index_user_listening_history import (
+    _index_user_listening_history,
+)
+from src.utils import helpers
+from src.utils.db_session import get_db
+from src.utils.redis_connection import get_redis
+
+TIMESTAMP_1 = datetime(2011, 1, 1)
+TIMESTAMP_2 = datetime(2012, 2, 2)
+TIMESTAMP_3 = datetime(2013, 3, 3)
+
+test_entities = {
+    "tracks": [
+        {"track_id": 1, "title": "track 1"},
+        {"track_id": 2, "title": "track 2"},
+        {"track_id": 3, "title": "track 3"},
+    ],
+    "users": [
+        {"user_id": 1, "handle": "user-1"},
+        {"user_id": 2, "handle": "user-2"},
+        {"user_id": 3, "handle": "user-3"},
+    ],
+    "plays": [
+        # Note these plays are in chronological order so the
+        # listening history should pull them "backwards" for
+        # reverse chronological sort order.
+        {"item_id": 2, "user_id": 1, "created_at": TIMESTAMP_1},
+        {"item_id": 1, "user_id": 1, "created_at": TIMESTAMP_2},
+        {"item_id": 3, "user_id": 1, "created_at": TIMESTAMP_3},
+        {"item_id": 1, "user_id": 2, "created_at": TIMESTAMP_2},
+    ],
+}
+
+
+@pytest.fixture(scope="module")
+def seeded_db():
+    """Bootstraps the app, populates the mock db, and runs the listening
+    history indexer once for the whole module - the tests below only read"""
+    # Same bootstrap as the function-scoped `app` fixture in conftest,
+    # run at module scope since no test here writes to the db
+    if database_exists(DB_URL):
+        drop_database(DB_URL)
+    create_database(DB_URL)
+    get_redis().flushall()
+    helpers.reset_logging()
+
+    alembic_dir = os.getcwd()
+    alembic_config = alembic.config.Config(f"{alembic_dir}/alembic.ini")
+    alembic_config.set_main_option("sqlalchemy.url", str(DB_URL))
+    alembic_config.set_main_option("mode", "test")
+    with helpers.cd(alembic_dir):
+        alembic.command.upgrade(alembic_config, "head")
+
+    app = create_app(TEST_CONFIG_OVERRIDE)
+    with app.app_context():
+        db = get_db()
+
+    populate_mock_db(db, test_entities)
+    with db.scoped_session() as session:
+        _index_user_listening_history(session)
+
+    yield db
+
+
+def test_get_user_listening_history_multiple_plays(seeded_db):
+    """Tests listening history from a user with multiple plays"""
+    with seeded_db.scoped_session() as session:
+        track_history = _get_user_listening_history(
+            session,
+            GetUserListeningHistoryArgs(
+                user_id=1,
+                current_user_id=1,
+                limit=10,
+                offset=0,
+                with_users=True,
+            ),
+        )
+
+    assert len(track_history) == 3
+    assert track_history[0]["track_id"] == 3
+    assert track_history[0]["activity_timestamp"] == str(TIMESTAMP_3)
+    assert track_history[1]["track_id"] == 1
+    assert track_history[1]["activity_timestamp"] == str(TIMESTAMP_2)
+    assert track_history[2]["track_id"] == 2
+    assert track_history[2]["activity_timestamp"] == str(TIMESTAMP_1)
+
+
+def test_get_user_listening_history_pagination(seeded_db):
+    """Tests listening history pagination is applied in listen order"""
+    with seeded_db.scoped_session() as session:
+        track_history = _get_user_listening_history(
+            session,
+            GetUserListeningHistoryArgs(
+                user_id=1,
+                current_user_id=1,
+                limit=1,
+                offset=1,
+                with_users=True,
+            ),
+        )
+
+    assert len(track_history) == 1
+    assert track_history[0]["track_id"] == 1
+    assert track_history[0]["activity_timestamp"] == str(TIMESTAMP_2)
+
+
+def test_get_user_listening_history_no_plays(seeded_db):
+    """Tests a user's listening history with no plays"""
+    with seeded_db.scoped_session() as session:
+        track_history = _get_user_listening_history(
+            session,
+            GetUserListeningHistoryArgs(
+                user_id=3,
+                current_user_id=3,
+                limit=10,
+                offset=0,
+                with_users=True,
+            ),
+        )
+
+    assert len(track_history) == 0
+
+
+def test_get_user_listening_history_does_not_include_other_users(seeded_db):
+    """Tests a user's listening history only contains their own plays"""
+    with seeded_db.scoped_session() as session:
+        track_history = _get_user_listening_history(
+            session,
+            GetUserListeningHistoryArgs(
+                user_id=2,
+                current_user_id=2,
+                limit=10,
+                offset=0,
+                with_users=True,
+            ),
+        )
+
+    assert len(track_history) == 1
+    assert track_history[0]["track_id"] == 1
+    assert track_history[0]["activity_timestamp"] == str(TIMESTAMP_2)
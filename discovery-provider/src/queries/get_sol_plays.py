@@ -3,7 +3,7 @@ from datetime import datetime
 from typing import List, Optional, TypedDict
 
 from redis import Redis
-from sqlalchemy import desc, func
+from sqlalchemy import desc, text
 from src import exceptions
 from src.models import Play
 from src.queries.query_helpers import get_sum_aggregate_plays, get_track_play_counts
@@ -67,7 +67,7 @@ def get_latest_sol_plays(limit=10) -> Optional[List[PlayDict]]:
         )
         query_results = base_query.all()
         if query_results:
-            sol_plays = helpers.query_result_to_list(query_results)
+            sol_plays = helpers.fast_query_result_to_list(query_results)
 
     return sol_plays
 
@@ -77,16 +77,23 @@ def get_track_listen_milestones(limit=100):
     db = get_db_read_replica()
 
     with db.scoped_session() as session:
-        results = (
-            session.query(
-                Play.play_item_id.distinct().label("play_item_id"),
-                func.max(Play.created_at).label("max"),
-            )
-            .group_by(Play.play_item_id)
-            .order_by(desc("max"))
-            .limit(limit)
-            .all()
+        # DISTINCT ON walks the (play_item_id, created_at DESC) index to find
+        # the most recent listen per track, instead of aggregating the entire
+        # plays table before applying the limit. Only play_item_id is
+        # projected, so run it as a core text query with no ORM row overhead.
+        query = text(
+            """
+            select play_item_id
+            from (
+                select distinct on (play_item_id) play_item_id, created_at
+                from plays
+                order by play_item_id, created_at desc
+            ) as recent_plays
+            order by created_at desc
+            limit :limit
+            """
         )
+        results = session.execute(query, {"limit": limit}).fetchall()
 
         track_ids = [result[0] for result in results]
         track_id_play_counts = get_track_play_counts(session, track_ids)
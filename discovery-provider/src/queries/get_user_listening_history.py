@@ -0,0 +1,111 @@
+from typing import TypedDict
+
+from sqlalchemy import Integer, String, text
+from sqlalchemy.orm.session import Session
+from src.models import Track
+from src.queries import response_name_constants
+from src.queries.query_helpers import (
+    get_users_by_id,
+    get_users_ids,
+    populate_track_metadata,
+)
+from src.utils import helpers
+from src.utils.db_session import get_db_read_replica
+
+
+class GetUserListeningHistoryArgs(TypedDict):
+    # The user id whose listening history to return
+    user_id: int
+
+    # The current user logged in (from query arg)
+    current_user_id: int
+
+    # The maximum number of listens to return
+    limit: int
+
+    # The offset for the listen history
+    offset: int
+
+    # Whether or not to bundle in the tracks' owners
+    with_users: bool
+
+
+def get_user_listening_history(args: GetUserListeningHistoryArgs):
+    """
+    Returns a user's listening history
+
+    Args:
+        args: GetUserListeningHistoryArgs The parsed args from the request
+
+    Returns:
+        Array of tracks the user listened to starting from most recently listened
+    """
+
+    db = get_db_read_replica()
+    with db.scoped_session() as session:
+        return _get_user_listening_history(session, args)
+
+
+# Unnests the JSONB listening history with ordinality so postgres applies
+# the pagination window server-side and returns rows already in listen
+# order - only the requested page is shipped and joined against tracks
+LISTENING_HISTORY_QUERY = """
+    SELECT
+        (listen->>'track_id')::int AS track_id,
+        listen->>'timestamp' AS listen_date,
+        ord AS listen_index
+    FROM
+        user_listening_history,
+        jsonb_array_elements(listening_history) WITH ORDINALITY AS h(listen, ord)
+    WHERE user_id = :user_id
+    ORDER BY ord
+    OFFSET :offset
+    LIMIT :limit
+"""
+
+
+def _get_user_listening_history(session: Session, args: GetUserListeningHistoryArgs):
+    user_id = args["user_id"]
+    current_user_id = args["current_user_id"]
+    limit = args["limit"]
+    offset = args["offset"]
+
+    listen_history = (
+        text(LISTENING_HISTORY_QUERY)
+        .columns(track_id=Integer, listen_date=String, listen_index=Integer)
+        .bindparams(user_id=user_id, limit=limit, offset=offset)
+        .alias("listen_history")
+    )
+
+    query_results = (
+        session.query(Track, listen_history.c.listen_date)
+        .join(listen_history, listen_history.c.track_id == Track.track_id)
+        .filter(Track.is_current == True)
+        .order_by(listen_history.c.listen_index)
+        .all()
+    )
+
+    if not query_results:
+        return []
+
+    tracks, listen_dates = zip(*query_results)
+    tracks = helpers.query_result_to_list(tracks)
+    track_ids = [track["track_id"] for track in tracks]
+
+    # bundle peripheral info into track results
+    tracks = populate_track_metadata(session, track_ids, tracks, current_user_id)
+
+    if args.get("with_users", False):
+        # bulk fetch the track owners in a single query rather than
+        # resolving them one at a time per track
+        user_id_list = get_users_ids(tracks)
+        users = get_users_by_id(session, user_id_list, current_user_id)
+        for track in tracks:
+            user = users[track["owner_id"]]
+            if user:
+                track["user"] = user
+
+    for idx, track in enumerate(tracks):
+        track[response_name_constants.activity_timestamp] = listen_dates[idx]
+
+    return tracks
@@ -362,11 +362,9 @@ def populate_track_metadata(session, track_ids, tracks, current_user_id):
         )
         followee_track_reposts = helpers.query_result_to_list(followee_track_reposts)
         for track_repost in followee_track_reposts:
-            if track_repost["repost_item_id"] not in followee_track_repost_dict:
-                followee_track_repost_dict[track_repost["repost_item_id"]] = []
-            followee_track_repost_dict[track_repost["repost_item_id"]].append(
-                track_repost
-            )
+            followee_track_repost_dict.setdefault(
+                track_repost["repost_item_id"], []
+            ).append(track_repost)
 
         # Build dict of track id --> followee saves.
         followee_track_saves = session.query(Save).filter(
@@ -378,9 +376,9 @@ def populate_track_metadata(session, track_ids, tracks, current_user_id):
         )
         followee_track_saves = helpers.query_result_to_list(followee_track_saves)
         for track_save in followee_track_saves:
-            if track_save["save_item_id"] not in followee_track_save_dict:
-                followee_track_save_dict[track_save["save_item_id"]] = []
-            followee_track_save_dict[track_save["save_item_id"]].append(track_save)
+            followee_track_save_dict.setdefault(track_save["save_item_id"], []).append(
+                track_save
+            )
 
     for track in tracks:
         track_id = track["track_id"]
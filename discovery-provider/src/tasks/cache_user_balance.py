@@ -1,5 +1,8 @@
+import concurrent.futures
 import logging
 import time
+from functools import lru_cache
+from itertools import islice
 from typing import Any, Dict, List, Optional, Set, Tuple, TypedDict
 
 from redis import Redis
@@ -26,6 +29,7 @@ from src.tasks.celery_app import celery
 from src.utils.config import shared_config
 from src.utils.redis_constants import user_balances_refresh_last_completion_redis_key
 from src.utils.session_manager import SessionManager
+from web3 import Web3
 
 logger = logging.getLogger(__name__)
 audius_token_registry_key = bytes("Token", "utf-8")
@@ -39,6 +43,17 @@ WAUDIO_MINT_PUBKEY = PublicKey(WAUDIO_MINT) if WAUDIO_MINT else None
 
 MAX_LAZY_REFRESH_USER_IDS = 100
 
+# Number of users to refresh per session - each batch is committed and
+# cleared from redis before the next one starts
+BALANCE_REFRESH_BATCH_SIZE = 100
+
+# Number of set members to pull per SSCAN iteration when draining
+# the refresh queues
+REDIS_SSCAN_COUNT = 500
+
+# Maximum number of in-flight eth RPCs when batch fetching wallet balances
+MAX_ETH_CALL_WORKERS = 25
+
 # Sol balances have 8 decimals, so they need to be increased to 18 to match eth balances
 SPL_TO_WEI = 10 ** 10
 
@@ -55,32 +70,120 @@ class UserWalletMetadata(TypedDict):
 
 
 def get_lazy_refresh_user_ids(redis: Redis, session: Session) -> List[int]:
-    redis_user_ids = redis.smembers(LAZY_REFRESH_REDIS_PREFIX)
-    user_ids = [int(user_id.decode()) for user_id in redis_user_ids]
-
-    user_balances = (
-        (session.query(UserBalance)).filter(UserBalance.user_id.in_(user_ids)).all()
+    # Stream the set with SSCAN rather than materializing the whole queue
+    # with SMEMBERS - bounds memory on large backlogs and lets us stop
+    # scanning once a full batch of refreshable users has been found
+    redis_user_ids = map(
+        int, redis.sscan_iter(LAZY_REFRESH_REDIS_PREFIX, count=REDIS_SSCAN_COUNT)
     )
 
-    # Filter only user_balances that still need refresh
-    needs_refresh: Set[int] = {
-        user.user_id
-        for user in list(filter(does_user_balance_need_refresh, user_balances))
-    }
+    needs_refresh: Set[int] = set()
+    while len(needs_refresh) < MAX_LAZY_REFRESH_USER_IDS:
+        user_ids = list(islice(redis_user_ids, REDIS_SSCAN_COUNT))
+        if not user_ids:
+            break
+
+        user_balances = (
+            (session.query(UserBalance)).filter(UserBalance.user_id.in_(user_ids)).all()
+        )
+
+        # Filter only user_balances that still need refresh
+        needs_refresh.update(
+            user.user_id
+            for user in user_balances
+            if does_user_balance_need_refresh(user)
+        )
 
     # return user id of needs_refresh
     return list(needs_refresh)
 
 
 def get_immediate_refresh_user_ids(redis: Redis) -> List[int]:
-    redis_user_ids = redis.smembers(IMMEDIATE_REFRESH_REDIS_PREFIX)
-    return [int(user_id.decode()) for user_id in redis_user_ids]
+    # SSCAN may return duplicates across iterations, so dedupe via a set
+    return list(
+        {
+            int(user_id)
+            for user_id in redis.sscan_iter(
+                IMMEDIATE_REFRESH_REDIS_PREFIX, count=REDIS_SSCAN_COUNT
+            )
+        }
+    )
 
 
 def to_wei(balance: Any):
     return int(balance) * SPL_TO_WEI if balance else 0
 
 
+@lru_cache(maxsize=200_000)
+def to_checksum_address(wallet: str) -> str:
+    # toChecksumAddress runs a keccak hash over the address on every call;
+    # wallets repeat across refresh cycles, so memoize the conversion
+    return Web3.toChecksumAddress(wallet)
+
+
+def fetch_eth_balances(
+    token_contract,
+    delegate_manager_contract,
+    staking_contract,
+    user_id_metadata: Dict[int, UserWalletMetadata],
+) -> Dict[Tuple[str, str], int]:
+    """Batch fetches token/delegation/staking balances for all eth wallets.
+
+    Each contract ``.call()`` is a blocking HTTP round-trip, so issuing them
+    sequentially per user makes the refresh latency-bound rather than
+    compute-bound. Collect every wallet up front and fan the calls out
+    concurrently, returning a mapping of
+    (call type, checksum wallet) => balance.
+    Wallets whose calls fail are left out of the mapping so callers can skip
+    just the affected users.
+    """
+    balance_calls = {}
+    for user_id, wallets in user_id_metadata.items():
+        # A malformed wallet must only skip its own user - no calls get
+        # queued for it, so the refresh loop below hits a KeyError for just
+        # that user and logs/skips it like any other failed fetch
+        try:
+            owner_wallet = to_checksum_address(wallets["owner_wallet"])
+            balance_calls[
+                ("balance", owner_wallet)
+            ] = token_contract.functions.balanceOf(owner_wallet)
+            for wallet in wallets["associated_wallets"]["eth"]:
+                wallet = to_checksum_address(wallet)
+                balance_calls[("balance", wallet)] = token_contract.functions.balanceOf(
+                    wallet
+                )
+                balance_calls[
+                    ("delegation", wallet)
+                ] = delegate_manager_contract.functions.getTotalDelegatorStake(wallet)
+                balance_calls[
+                    ("stake", wallet)
+                ] = staking_contract.functions.totalStakedFor(wallet)
+        except Exception as e:
+            logger.error(
+                f"cache_user_balance.py | Error building balance calls for user {user_id}: {e}"
+            )
+
+    eth_balances: Dict[Tuple[str, str], int] = {}
+    if not balance_calls:
+        return eth_balances
+
+    num_workers = min(MAX_ETH_CALL_WORKERS, len(balance_calls))
+    with concurrent.futures.ThreadPoolExecutor(max_workers=num_workers) as executor:
+        future_to_balance_call = {
+            executor.submit(contract_function.call): call_key
+            for call_key, contract_function in balance_calls.items()
+        }
+        for future in concurrent.futures.as_completed(future_to_balance_call):
+            call_type, wallet = future_to_balance_call[future]
+            try:
+                eth_balances[(call_type, wallet)] = future.result()
+            except Exception as e:
+                logger.error(
+                    f"cache_user_balance.py | Error fetching {call_type} for wallet {wallet}: {e}"
+                )
+    return eth_balances
+
+
 # *Explanation of user balance caching*
 # In an effort to minimize eth calls, we look up users embedded in track metadata once per user,
 # and current users (logged in dapp users, who might be changing their balance) on an interval.
@@ -115,30 +218,68 @@ def refresh_user_ids(
     eth_web3,
     waudio_token,
 ):
+    # Gather the ids needing refresh, then work through them in bounded
+    # batches. Each batch commits in its own short-lived session and is
+    # removed from redis right after, so progress survives transient
+    # failures and row locks are not held across hundreds of eth calls.
     with db.scoped_session() as session:
         lazy_refresh_user_ids = get_lazy_refresh_user_ids(redis, session)[
             :MAX_LAZY_REFRESH_USER_IDS
         ]
-        immediate_refresh_user_ids = get_immediate_refresh_user_ids(redis)
+    immediate_refresh_user_ids = get_immediate_refresh_user_ids(redis)
 
-        logger.info(
-            f"cache_user_balance.py | Starting refresh with {len(lazy_refresh_user_ids)} "
-            f"lazy refresh user_ids: {lazy_refresh_user_ids} and {len(immediate_refresh_user_ids)} "
-            f"immediate refresh user_ids: {immediate_refresh_user_ids}"
-        )
-        all_user_ids = lazy_refresh_user_ids + immediate_refresh_user_ids
-        user_ids = list(set(all_user_ids))
+    logger.info(
+        f"cache_user_balance.py | Starting refresh with {len(lazy_refresh_user_ids)} "
+        f"lazy refresh user_ids: {lazy_refresh_user_ids} and {len(immediate_refresh_user_ids)} "
+        f"immediate refresh user_ids: {immediate_refresh_user_ids}"
+    )
+    lazy_refresh_set = set(lazy_refresh_user_ids)
+    immediate_refresh_set = set(immediate_refresh_user_ids)
+    user_ids = list(lazy_refresh_set | immediate_refresh_set)
+
+    for batch_start in range(0, len(user_ids), BALANCE_REFRESH_BATCH_SIZE):
+        user_id_batch = user_ids[batch_start : batch_start + BALANCE_REFRESH_BATCH_SIZE]
+        with db.scoped_session() as session:
+            _refresh_user_id_batch(
+                session,
+                token_contract,
+                delegate_manager_contract,
+                staking_contract,
+                eth_web3,
+                waudio_token,
+                user_id_batch,
+            )
 
-        existing_user_balances: List[UserBalance] = (
-            (session.query(UserBalance)).filter(UserBalance.user_id.in_(user_ids)).all()
-        )
-        all_user_balance = existing_user_balances
+        # The scoped session has committed on exit - only now is it safe to
+        # drop the batch from the redis queues so a crash cannot lose work
+        # that was already paid for
+        lazy_batch = lazy_refresh_set.intersection(user_id_batch)
+        if lazy_batch:
+            redis.srem(LAZY_REFRESH_REDIS_PREFIX, *lazy_batch)
+        immediate_batch = immediate_refresh_set.intersection(user_id_batch)
+        if immediate_batch:
+            redis.srem(IMMEDIATE_REFRESH_REDIS_PREFIX, *immediate_batch)
 
-        # Balances from current user lookup may
-        # not be present in the db, so make those
-        not_present_set = set(user_ids) - {
-            user.user_id for user in existing_user_balances
-        }
+
+def _refresh_user_id_batch(
+    session: Session,
+    token_contract,
+    delegate_manager_contract,
+    staking_contract,
+    eth_web3,
+    waudio_token,
+    user_ids: List[int],
+):
+    user_ids_set = set(user_ids)
+    existing_user_balances: List[UserBalance] = (
+        (session.query(UserBalance)).filter(UserBalance.user_id.in_(user_ids)).all()
+    )
+    user_balances = {user.user_id: user for user in existing_user_balances}
+
+    # Balances from current user lookup may
+    # not be present in the db, so make those
+    not_present_set = user_ids_set - user_balances.keys()
+    if not_present_set:
         new_balances: List[UserBalance] = [
             UserBalance(
                 user_id=user_id,
@@ -148,241 +289,225 @@ def refresh_user_ids(
             )
             for user_id in not_present_set
         ]
-        if new_balances:
-            session.add_all(new_balances)
-            all_user_balance = existing_user_balances + new_balances
-            logger.info(f"cache_user_balance.py | adding new users: {not_present_set}")
-
-        user_balances = {user.user_id: user for user in all_user_balance}
-
-        # Grab the users & associated_wallets we need to refresh
-        user_associated_wallet_query: List[Tuple[int, str, str, str]] = (
-            session.query(
-                User.user_id,
-                User.wallet,
-                AssociatedWallet.wallet,
-                AssociatedWallet.chain,
-            )
-            .outerjoin(
-                AssociatedWallet,
-                and_(
-                    AssociatedWallet.user_id == User.user_id,
-                    AssociatedWallet.is_current == True,
-                    AssociatedWallet.is_delete == False,
-                ),
-            )
-            .filter(
-                User.user_id.in_(user_ids),
-                User.is_current == True,
-            )
-            .all()
+        session.add_all(new_balances)
+        user_balances.update({user.user_id: user for user in new_balances})
+        logger.info(f"cache_user_balance.py | adding new users: {not_present_set}")
+
+    # Grab the users & associated_wallets we need to refresh
+    user_associated_wallet_query: List[Tuple[int, str, str, str]] = (
+        session.query(
+            User.user_id,
+            User.wallet,
+            AssociatedWallet.wallet,
+            AssociatedWallet.chain,
         )
+        .outerjoin(
+            AssociatedWallet,
+            and_(
+                AssociatedWallet.user_id == User.user_id,
+                AssociatedWallet.is_current == True,
+                AssociatedWallet.is_delete == False,
+            ),
+        )
+        .filter(
+            User.user_id.in_(user_ids),
+            User.is_current == True,
+        )
+        .all()
+    )
 
-        user_bank_accounts_query: List[Tuple[int, str]] = (
-            session.query(User.user_id, UserBankAccount.bank_account)
-            .join(UserBankAccount, UserBankAccount.ethereum_address == User.wallet)
-            .filter(
-                User.user_id.in_(user_ids),
-                User.is_current == True,
-            )
-            .all()
+    user_bank_accounts_query: List[Tuple[int, str]] = (
+        session.query(User.user_id, UserBankAccount.bank_account)
+        .join(UserBankAccount, UserBankAccount.ethereum_address == User.wallet)
+        .filter(
+            User.user_id.in_(user_ids),
+            User.is_current == True,
         )
-        user_id_bank_accounts = dict(user_bank_accounts_query)
-
-        # Combine query results for user bank, associated wallets,
-        # and primary owner wallet into a single metadata list
-        user_id_metadata: Dict[int, UserWalletMetadata] = {}
-
-        for user in user_associated_wallet_query:
-            user_id, user_wallet, associated_wallet, wallet_chain = user
-            if user_id not in user_id_metadata:
-                user_id_metadata[user_id] = {
-                    "owner_wallet": user_wallet,
-                    "associated_wallets": {"eth": [], "sol": []},
-                    "bank_account": None,
-                }
-                if user_id in user_id_bank_accounts:
-                    user_id_metadata[user_id]["bank_account"] = user_id_bank_accounts[
-                        user_id
-                    ]
-            if associated_wallet:
-                if user_id in user_id_metadata:
-                    user_id_metadata[user_id]["associated_wallets"][
-                        wallet_chain  # type: ignore
-                    ].append(associated_wallet)
-
-        logger.info(
-            f"cache_user_balance.py | fetching for {len(user_associated_wallet_query)} users: {user_ids}"
+        .all()
+    )
+    user_id_bank_accounts = dict(user_bank_accounts_query)
+
+    # Combine query results for user bank, associated wallets,
+    # and primary owner wallet into a single metadata list
+    user_id_metadata: Dict[int, UserWalletMetadata] = {}
+
+    for (
+        user_id,
+        user_wallet,
+        associated_wallet,
+        wallet_chain,
+    ) in user_associated_wallet_query:
+        # setdefault keeps this a single dict lookup per row rather than
+        # separate membership checks for the user and its wallet lists
+        wallets = user_id_metadata.setdefault(
+            user_id,
+            {
+                "owner_wallet": user_wallet,
+                "associated_wallets": {"eth": [], "sol": []},
+                "bank_account": user_id_bank_accounts.get(user_id),
+            },
         )
+        if associated_wallet:
+            wallets["associated_wallets"][wallet_chain].append(  # type: ignore
+                associated_wallet
+            )
 
-        # mapping of user_id => balance change
-        needs_balance_change_update: Dict[int, Dict] = {}
+    logger.info(
+        f"cache_user_balance.py | fetching for {len(user_associated_wallet_query)} users: {user_ids}"
+    )
 
-        # Fetch balances
-        # pylint: disable=too-many-nested-blocks
-        for user_id, wallets in user_id_metadata.items():
-            try:
-                owner_wallet = wallets["owner_wallet"]
-                owner_wallet = eth_web3.toChecksumAddress(owner_wallet)
-                owner_wallet_balance = token_contract.functions.balanceOf(
-                    owner_wallet
-                ).call()
-                associated_balance = 0
-                waudio_balance = "0"
-                associated_sol_balance = 0
-
-                if "associated_wallets" in wallets:
-                    for wallet in wallets["associated_wallets"]["eth"]:
-                        wallet = eth_web3.toChecksumAddress(wallet)
-                        balance = token_contract.functions.balanceOf(wallet).call()
-                        delegation_balance = (
-                            delegate_manager_contract.functions.getTotalDelegatorStake(
-                                wallet
-                            ).call()
-                        )
-                        stake_balance = staking_contract.functions.totalStakedFor(
-                            wallet
-                        ).call()
-                        associated_balance += (
-                            balance + delegation_balance + stake_balance
-                        )
-                    if waudio_token is not None:
-                        for wallet in wallets["associated_wallets"]["sol"]:
-                            try:
-                                root_sol_account = PublicKey(wallet)
-                                derived_account, _ = PublicKey.find_program_address(
-                                    [
-                                        bytes(root_sol_account),
-                                        bytes(SPL_TOKEN_ID_PK),
-                                        bytes(WAUDIO_MINT_PUBKEY),  # type: ignore
-                                    ],
-                                    ASSOCIATED_TOKEN_PROGRAM_ID_PK,
-                                )
-                                bal_info = waudio_token.get_account_info(
-                                    derived_account
-                                )
-                                associated_waudio_balance: str = bal_info["result"][
-                                    "value"
-                                ]["amount"]
-                                associated_sol_balance += int(associated_waudio_balance)
-                            except Exception as e:
-                                logger.error(
-                                    " ".join(
-                                        [
-                                            "cache_user_balance.py | Error fetching associated ",
-                                            "wallet balance for user %s, wallet %s: %s",
-                                        ]
-                                    ),
-                                    user_id,
-                                    wallet,
-                                    e,
-                                )
-
-                if wallets["bank_account"] is not None:
-                    if waudio_token is None:
-                        logger.error(
-                            "cache_user_balance.py | Missing Required SPL Confirguration"
-                        )
-                    else:
-                        bal_info = waudio_token.get_balance(
-                            PublicKey(wallets["bank_account"])
-                        )
-                        waudio_balance = bal_info["result"]["value"]["amount"]
-
-                # update the balance on the user model
-                user_balance = user_balances[user_id]
-
-                # Convert Sol balances to wei
-                waudio_in_wei = to_wei(waudio_balance)
-                assoc_sol_balance_in_wei = to_wei(associated_sol_balance)
-                user_waudio_in_wei = to_wei(user_balance.waudio)
-                user_assoc_sol_balance_in_wei = to_wei(
-                    user_balance.associated_sol_wallets_balance
-                )
+    # mapping of user_id => balance change
+    needs_balance_change_update: Dict[int, Dict] = {}
 
-                # Get values for user balance change
-                current_total_balance = (
-                    owner_wallet_balance
-                    + associated_balance
-                    + waudio_in_wei
-                    + assoc_sol_balance_in_wei
-                )
-                prev_total_balance = (
-                    int(user_balance.balance)
-                    + int(user_balance.associated_wallets_balance)
-                    + user_waudio_in_wei
-                    + user_assoc_sol_balance_in_wei
-                )
+    # Batch fetch all the eth balances in a single concurrent pass
+    # rather than three sequential round-trips per wallet in the loop below
+    eth_balances = fetch_eth_balances(
+        token_contract,
+        delegate_manager_contract,
+        staking_contract,
+        user_id_metadata,
+    )
 
-                # Write to user_balance_changes table
-                needs_balance_change_update[user_id] = {
-                    "user_id": user_id,
-                    "blocknumber": eth_web3.eth.blockNumber,
-                    "current_balance": str(current_total_balance),
-                    "previous_balance": str(prev_total_balance),
-                }
-
-                user_balance.balance = str(owner_wallet_balance)
-                user_balance.associated_wallets_balance = str(associated_balance)
-                user_balance.waudio = waudio_balance
-                user_balance.associated_sol_wallets_balance = str(
-                    associated_sol_balance
-                )
+    # Fetch balances
+    # pylint: disable=too-many-nested-blocks
+    for user_id, wallets in user_id_metadata.items():
+        try:
+            owner_wallet = wallets["owner_wallet"]
+            owner_wallet = to_checksum_address(owner_wallet)
+            # A missing entry means the batched call for this wallet
+            # failed - raise so this user is skipped and retried later
+            owner_wallet_balance = eth_balances[("balance", owner_wallet)]
+            associated_balance = 0
+            waudio_balance = "0"
+            associated_sol_balance = 0
+
+            if "associated_wallets" in wallets:
+                for wallet in wallets["associated_wallets"]["eth"]:
+                    wallet = to_checksum_address(wallet)
+                    associated_balance += (
+                        eth_balances[("balance", wallet)]
+                        + eth_balances[("delegation", wallet)]
+                        + eth_balances[("stake", wallet)]
+                    )
+                if waudio_token is not None:
+                    for wallet in wallets["associated_wallets"]["sol"]:
+                        try:
+                            root_sol_account = PublicKey(wallet)
+                            derived_account, _ = PublicKey.find_program_address(
+                                [
+                                    bytes(root_sol_account),
+                                    bytes(SPL_TOKEN_ID_PK),
+                                    bytes(WAUDIO_MINT_PUBKEY),  # type: ignore
+                                ],
+                                ASSOCIATED_TOKEN_PROGRAM_ID_PK,
+                            )
+                            bal_info = waudio_token.get_account_info(derived_account)
+                            associated_waudio_balance: str = bal_info["result"][
+                                "value"
+                            ]["amount"]
+                            associated_sol_balance += int(associated_waudio_balance)
+                        except Exception as e:
+                            logger.error(
+                                " ".join(
+                                    [
+                                        "cache_user_balance.py | Error fetching associated ",
+                                        "wallet balance for user %s, wallet %s: %s",
+                                    ]
+                                ),
+                                user_id,
+                                wallet,
+                                e,
+                            )
+
+            if wallets["bank_account"] is not None:
+                if waudio_token is None:
+                    logger.error(
+                        "cache_user_balance.py | Missing Required SPL Confirguration"
+                    )
+                else:
+                    bal_info = waudio_token.get_balance(
+                        PublicKey(wallets["bank_account"])
+                    )
+                    waudio_balance = bal_info["result"]["value"]["amount"]
+
+            # update the balance on the user model
+            user_balance = user_balances[user_id]
+
+            # Convert Sol balances to wei
+            waudio_in_wei = to_wei(waudio_balance)
+            assoc_sol_balance_in_wei = to_wei(associated_sol_balance)
+            user_waudio_in_wei = to_wei(user_balance.waudio)
+            user_assoc_sol_balance_in_wei = to_wei(
+                user_balance.associated_sol_wallets_balance
+            )
 
-            except Exception as e:
-                logger.error(
-                    f"cache_user_balance.py | Error fetching balance for user {user_id}: {(e)}"
-                )
+            # Get values for user balance change
+            current_total_balance = (
+                owner_wallet_balance
+                + associated_balance
+                + waudio_in_wei
+                + assoc_sol_balance_in_wei
+            )
+            prev_total_balance = (
+                int(user_balance.balance)
+                + int(user_balance.associated_wallets_balance)
+                + user_waudio_in_wei
+                + user_assoc_sol_balance_in_wei
+            )
 
-        # Outside the loop, batch update the UserBalanceChanges:
+            # Write to user_balance_changes table
+            needs_balance_change_update[user_id] = {
+                "user_id": user_id,
+                "blocknumber": eth_web3.eth.blockNumber,
+                "current_balance": str(current_total_balance),
+                "previous_balance": str(prev_total_balance),
+            }
+
+            user_balance.balance = str(owner_wallet_balance)
+            user_balance.associated_wallets_balance = str(associated_balance)
+            user_balance.waudio = waudio_balance
+            user_balance.associated_sol_wallets_balance = str(associated_sol_balance)
+
+        except Exception as e:
+            logger.error(
+                f"cache_user_balance.py | Error fetching balance for user {user_id}: {(e)}"
+            )
 
-        # Get existing user balances
-        user_balance_ids = list(needs_balance_change_update.keys())
-        existing_user_balance_changes: List[UserBalanceChange] = (
-            session.query(UserBalanceChange)
-            .filter(UserBalanceChange.user_id.in_(user_balance_ids))
-            .all()
-        )
-        # Find all the IDs that don't already exist in the DB
-        to_create_ids = set(user_balance_ids) - {
-            e.user_id for e in existing_user_balance_changes
-        }
-        logger.info(
-            f"cache_user_balance.py | UserBalanceChanges needing update: {user_balance_ids},\
-                    existing: {[e.user_id for e in existing_user_balance_changes]}, to create: {to_create_ids}"
-        )
+    # Outside the loop, batch update the UserBalanceChanges:
 
-        # Create new entries for those IDs
-        balance_changes_to_add = [
-            UserBalanceChange(
-                user_id=user_id,
-                blocknumber=needs_balance_change_update[user_id]["blocknumber"],
-                current_balance=needs_balance_change_update[user_id]["current_balance"],
-                previous_balance=needs_balance_change_update[user_id][
-                    "previous_balance"
-                ],
-            )
-            for user_id in to_create_ids
-        ]
-        session.add_all(balance_changes_to_add)
-        # Lastly, update all the existing entries
-        for change in existing_user_balance_changes:
-            new_values = needs_balance_change_update[change.user_id]
-            change.blocknumber = new_values["blocknumber"]
-            change.current_balance = new_values["current_balance"]
-            change.previous_balance = new_values["previous_balance"]
-
-        # Commit the new balances
-        session.commit()
-
-        # Remove the fetched balances from Redis set
-        logger.info(
-            f"cache_user_balance.py | Got balances for {len(user_associated_wallet_query)} users, removing from Redis."
+    # Get existing user balances
+    user_balance_ids = list(needs_balance_change_update.keys())
+    existing_user_balance_changes: List[UserBalanceChange] = (
+        session.query(UserBalanceChange)
+        .filter(UserBalanceChange.user_id.in_(user_balance_ids))
+        .all()
+    )
+    # Find all the IDs that don't already exist in the DB
+    to_create_ids = set(user_balance_ids) - {
+        e.user_id for e in existing_user_balance_changes
+    }
+    logger.info(
+        f"cache_user_balance.py | UserBalanceChanges needing update: {user_balance_ids},\
+                existing: {[e.user_id for e in existing_user_balance_changes]}, to create: {to_create_ids}"
+    )
+
+    # Create new entries for those IDs
+    balance_changes_to_add = [
+        UserBalanceChange(
+            user_id=user_id,
+            blocknumber=needs_balance_change_update[user_id]["blocknumber"],
+            current_balance=needs_balance_change_update[user_id]["current_balance"],
+            previous_balance=needs_balance_change_update[user_id]["previous_balance"],
         )
-        if lazy_refresh_user_ids:
-            redis.srem(LAZY_REFRESH_REDIS_PREFIX, *lazy_refresh_user_ids)
-        if immediate_refresh_user_ids:
-            redis.srem(IMMEDIATE_REFRESH_REDIS_PREFIX, *immediate_refresh_user_ids)
+        for user_id in to_create_ids
+    ]
+    session.add_all(balance_changes_to_add)
+    # Lastly, update all the existing entries
+    for change in existing_user_balance_changes:
+        new_values = needs_balance_change_update[change.user_id]
+        change.blocknumber = new_values["blocknumber"]
+        change.current_balance = new_values["current_balance"]
+        change.previous_balance = new_values["previous_balance"]
 
 
 def get_token_address(eth_web3, config):
@@ -452,6 +577,42 @@ def get_staking_contract(eth_web3):
     return staking_instance
 
 
+# Contract instances resolved via the registry, cached at module scope.
+# Each resolution costs two blocking eth calls and registry entries do not
+# change within the lifetime of a worker process.
+eth_contract_cache: Dict[str, Any] = {}
+
+
+def get_balance_contracts(eth_web3, config):
+    """Returns the (token, delegate manager, staking) contract instances.
+
+    On first use the three registry lookups are issued concurrently (the
+    web3 HTTPProvider is thread-safe for reads); afterwards the resolved
+    instances are served from the module-scope cache.
+    """
+    if not eth_contract_cache:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
+            token_future = executor.submit(get_token_contract, eth_web3, config)
+            delegate_manager_future = executor.submit(
+                get_delegate_manager_contract, eth_web3
+            )
+            staking_future = executor.submit(get_staking_contract, eth_web3)
+            # Resolve all three before touching the cache - a partially
+            # populated cache would skip resolution on the next run and
+            # KeyError forever, where failing here just retries next schedule
+            token = token_future.result()
+            delegate_manager = delegate_manager_future.result()
+            staking = staking_future.result()
+        eth_contract_cache["token"] = token
+        eth_contract_cache["delegate_manager"] = delegate_manager
+        eth_contract_cache["staking"] = staking
+    return (
+        eth_contract_cache["token"],
+        eth_contract_cache["delegate_manager"],
+        eth_contract_cache["staking"],
+    )
+
+
 SPL_TOKEN_PROGRAM_ID_PUBKEY = PublicKey("TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA")
 
 
@@ -486,9 +647,7 @@ def update_user_balances_task(self):
         if have_lock:
             start_time = time.time()
 
-            delegate_manager_inst = get_delegate_manager_contract(eth_web3)
-            staking_inst = get_staking_contract(eth_web3)
-            token_inst = get_token_contract(
+            token_inst, delegate_manager_inst, staking_inst = get_balance_contracts(
                 eth_web3, update_user_balances_task.shared_config
             )
             waudio_token = get_audio_token(solana_client_manager.get_client())
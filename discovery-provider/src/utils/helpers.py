@@ -144,6 +144,31 @@ def query_result_to_list(query_result):
     return results
 
 
+# Cache of model class -> column keys used by fast_query_result_to_list;
+# a model's column set never changes at runtime
+_model_columns_cache: dict = {}
+
+
+def fast_query_result_to_list(query_result):
+    """Converts the given rows of a single model into dictionaries.
+
+    Unlike `query_result_to_list`, this only serializes plain columns -
+    no relationships, `@property` values, or `exclude_keys` handling - and
+    reflects over the model's columns once per class rather than per row.
+    Use it on hot paths for models that are pure column data (e.g. plays).
+    """
+    results = []
+    for row in query_result:
+        cls = type(row)
+        columns = _model_columns_cache.get(cls)
+        if columns is None:
+            columns = _model_columns_cache.setdefault(
+                cls, list(cls.__table__.columns.keys())
+            )
+        results.append({key: getattr(row, key) for key in columns})
+    return results
+
+
 def model_to_dictionary(model, exclude_keys=None):
     """Converts the given SQLAlchemy model into a dictionary, primarily used
     for serialization to JSON.
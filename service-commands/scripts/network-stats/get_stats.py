@@ -0,0 +1,128 @@
+"""Collects health check stats from every node in a service provider list.
+
+Usage:
+    python3 get_stats.py service-providers.json --output stats.json
+
+The input file is a JSON array of service providers, each entry containing
+at least an "endpoint" field. Prints a per-key distribution across the
+cluster and writes the raw per-node stats to the output file.
+"""
+
+import argparse
+import concurrent.futures
+from operator import itemgetter
+
+import numpy as np
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+
+HEALTH_CHECK_TIMEOUT = 3  # seconds
+MAX_WORKERS = 32
+
+# Shared session with a pool sized for the fan-out - keep-alive avoids a
+# fresh TCP+TLS handshake per endpoint (and per retry against the same host)
+session = requests.Session()
+adapter = HTTPAdapter(pool_connections=MAX_WORKERS, pool_maxsize=MAX_WORKERS)
+session.mount("https://", adapter)
+session.mount("http://", adapter)
+
+
+def size(num_bytes):
+    # bytes -> GB, rounded to the nearest GB with a branch-free integer shift
+    return (num_bytes + (1 << 29)) >> 30
+
+
+def parse_service_provider_list(path):
+    with open(path, "rb") as f:
+        service_provider_list = orjson.loads(f.read())
+    return [sp for sp in service_provider_list if sp.get("endpoint")]
+
+
+def get_health_check(endpoint):
+    r = session.get(f"{endpoint}/health_check", timeout=HEALTH_CHECK_TIMEOUT)
+    # orjson handles the raw bytes directly, skipping the r.text decode
+    return orjson.loads(r.content)
+
+
+def parse_stats(endpoint, health_response):
+    data = health_response.get("data", health_response)
+    return {
+        "endpoint": endpoint,
+        "block_difference": data.get("block_difference") or 0,
+        "database_size": size(data.get("database_size") or 0),
+        "total_memory": size(data.get("total_memory") or 0),
+        "used_memory": size(data.get("used_memory") or 0),
+        "filesystem_size": size(data.get("filesystem_size") or 0),
+        "filesystem_used": size(data.get("filesystem_used") or 0),
+    }
+
+
+def report_stats(service_provider_list):
+    # Fan the health checks out in parallel - each one is a pure I/O wait,
+    # so wall time is the slowest node rather than the sum over all nodes
+    stats = []
+    num_workers = min(MAX_WORKERS, len(service_provider_list))
+    with concurrent.futures.ThreadPoolExecutor(max_workers=num_workers) as executor:
+        future_to_service_provider = {
+            executor.submit(get_health_check, sp["endpoint"]): sp
+            for sp in service_provider_list
+        }
+        for future in concurrent.futures.as_completed(future_to_service_provider):
+            sp = future_to_service_provider[future]
+            try:
+                stats.append(parse_stats(sp["endpoint"], future.result()))
+            except Exception as e:
+                print(f"Failed health check for {sp['endpoint']}: {e}")
+    return stats
+
+
+def show_cluster_wide_stats(stats):
+    # numpy sorts and interpolates the percentiles in C instead of
+    # sorting python lists per key
+    keys = [key for key in stats[0] if key != "endpoint"]
+    for key in keys:
+        key_stats = np.fromiter(
+            map(itemgetter(key), stats), dtype=float, count=len(stats)
+        )
+        p50, p95, p99 = np.percentile(key_stats, [50, 95, 99])
+        print(
+            f"{key}: min={key_stats.min():g} p50={p50:g} "
+            f"p95={p95:g} p99={p99:g} max={key_stats.max():g}"
+        )
+
+
+def generate_stats_json(stats, output_path):
+    with open(output_path, "wb") as f:
+        f.write(orjson.dumps({"stats": stats}, option=orjson.OPT_INDENT_2))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Collect health check stats across service providers"
+    )
+    parser.add_argument(
+        "service_provider_list",
+        help="JSON file containing an array of service providers with endpoints",
+    )
+    parser.add_argument(
+        "--output", default="stats.json", help="File to write per-node stats to"
+    )
+    args = parser.parse_args()
+
+    service_provider_list = parse_service_provider_list(args.service_provider_list)
+    stats = report_stats(service_provider_list)
+    if not stats:
+        print("No nodes responded to health checks")
+        return
+
+    show_cluster_wide_stats(stats)
+    generate_stats_json(stats, args.output)
+    print(
+        f"Wrote stats for {len(stats)}/{len(service_provider_list)} "
+        f"nodes to {args.output}"
+    )
+
+
+if __name__ == "__main__":
+    main()